@@ -2,7 +2,7 @@
 import os
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import UnityPy
 
 
@@ -119,6 +119,37 @@ class BundleManager:
         
         return None
     
+    def get_objects_from_bundle(self, bundle_name: str, object_names: List[str]) -> Dict[str, Any]:
+        """
+        Get several objects from a bundle, reading and scanning it only once.
+        
+        Args:
+            bundle_name: Name of the bundle file
+            object_names: Names of the objects to retrieve
+            
+        Returns:
+            Dictionary mapping each requested name to its typetree dictionary, or None if not found
+        """
+        found = dict.fromkeys(object_names)
+        env = self.read_bundle(bundle_name)
+        if env is None:
+            return found
+        
+        remaining = set(object_names)
+        for obj in env.objects:
+            if obj.type.name == "MonoBehaviour":
+                try:
+                    tree = obj.read_typetree()
+                    if isinstance(tree, dict) and tree.get('m_Name') in remaining:
+                        found[tree['m_Name']] = tree
+                        remaining.discard(tree['m_Name'])
+                        if not remaining:
+                            break
+                except Exception as e:
+                    pass
+        
+        return found
+    
     def get_unitypy_object_from_bundle(self, bundle_name: str, object_name: str) -> Optional[Any]:
         """
         Get the UnityPy object (not just the typetree) from a bundle.
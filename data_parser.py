@@ -756,4 +756,49 @@ class DataParser:
             a = int(hex_str[6:8], 16) / 255.0
             return (r, g, b, a)
         return (1.0, 1.0, 1.0, 1.0)
+    
+    @staticmethod
+    def rgba_list_to_hex(colors_rgba: List[Tuple[float, ...]]) -> List[str]:
+        """
+        Convert a list of RGBA (0.0-1.0) tuples to #RRGGBBAA strings in one pass.
+        
+        Args:
+            colors_rgba: RGBA tuples; alpha defaults to 1.0 when only RGB is given
+            
+        Returns:
+            List of hex strings, with "#FFFFFF" for entries that have fewer than three components
+        """
+        valid = [len(rgba) >= 3 for rgba in colors_rgba]
+        packed = bytearray(
+            int(max(0, min(255, c * 255)))
+            for rgba, ok in zip(colors_rgba, valid) if ok
+            for c in (rgba[:4] if len(rgba) >= 4 else (*rgba[:3], 1.0))
+        )
+        hex_str = packed.hex().upper()
+        chunks = (hex_str[i:i + 8] for i in range(0, len(hex_str), 8))
+        return [f"#{next(chunks)}" if ok else "#FFFFFF" for ok in valid]
+    
+    @staticmethod
+    def hex_list_to_rgba(hex_colors: List[str]) -> List[Tuple[float, float, float, float]]:
+        """
+        Convert a list of hex strings (#RRGGBB or #RRGGBBAA) to RGBA (0.0-1.0) tuples.
+        
+        Args:
+            hex_colors: Hex colour strings
+            
+        Returns:
+            List of RGBA tuples, with opaque white for strings of any other length
+        """
+        result = []
+        for hex_color in hex_colors:
+            hex_str = hex_color.lstrip('#')
+            if len(hex_str) == 6:
+                r, g, b = bytes.fromhex(hex_str)
+                result.append((r / 255.0, g / 255.0, b / 255.0, 1.0))
+            elif len(hex_str) == 8:
+                r, g, b, a = bytes.fromhex(hex_str)
+                result.append((r / 255.0, g / 255.0, b / 255.0, a / 255.0))
+            else:
+                result.append((1.0, 1.0, 1.0, 1.0))
+        return result
 
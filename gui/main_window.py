@@ -1,19 +1,277 @@
 """Main application window."""
 import sys
 import os
+import re
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QFileDialog, QTabWidget, QSplitter,
                              QMessageBox, QStatusBar, QLabel, QGroupBox, QTextEdit, QDialog, QDialogButtonBox,
-                             QGridLayout, QCheckBox, QListWidget)
-from PyQt6.QtCore import Qt, pyqtSignal
+                             QGridLayout, QCheckBox, QListWidget, QProgressBar)
+from PyQt6.QtCore import Qt, pyqtSignal, QSignalBlocker, QTimer, QObject, QRunnable, QThreadPool
 from PyQt6.QtGui import QIcon
 
-from bundle_manager import BundleManager
-from data_parser import DataParser
-from backup_manager import BackupManager
-from gui.threshold_editor import ThresholdEditor
+if TYPE_CHECKING:
+    from bundle_manager import BundleManager
+    from data_parser import DataParser
+    from backup_manager import BackupManager
+    from gui.threshold_editor import ThresholdEditor
+
+
+_CUSTOM_RE = re.compile(r"^attribute-colour-custom-(\d+)$")
+_ROW_NUMBER_TRIPLE = ("attributes-row-number",) * 3
+_VDF_PATH_RE = re.compile(r'"path"\s+"([^"]+)"')
+
+# Install locations and the bundle directories to look for under them
+_WIN_SUBPATHS = (
+    "fm_Data/StreamingAssets/aa/StandaloneWindows64",
+    "data/StreamingAssets/aa/StandaloneWindows64",
+)
+_WIN_STEAM_FALLBACK = (
+    Path(os.getenv("PROGRAMFILES(X86)", "C:/Program Files (x86)"))
+    / "Steam/steamapps/common/Football Manager 26"
+)
+_WIN_EPIC_FALLBACK = (
+    Path(os.getenv("PROGRAMFILES", "C:/Program Files")) / "Epic Games/Football Manager 26"
+)
+# Xbox Game Pass - check C:, D:, E: drives
+_XBOX_BASES = tuple(
+    Path(f"{drive}/XboxGames/Football Manager 26/Content") for drive in ("C:", "D:", "E:")
+)
+# Relative bases are joined onto the home directory; absolute ones are used as-is
+_MAC_SEARCHES = (
+    (
+        Path("Library/Application Support/Steam/steamapps/common/Football Manager 26"),
+        (
+            "fm.app/Contents/Resources/Data/StreamingAssets/aa/StandaloneOSX",
+            "fm_Data/StreamingAssets/aa/StandaloneOSXUniversal",
+        ),
+    ),
+    (
+        Path("Library/Application Support/Epic/Football Manager 26"),
+        ("fm_Data/StreamingAssets/aa/StandaloneOSXUniversal",),
+    ),
+)
+_LINUX_SEARCHES = (
+    (
+        Path(".local/share/Steam/steamapps/common/Football Manager 26"),
+        ("fm_Data/StreamingAssets/aa/StandaloneLinux64",),
+    ),
+    (
+        Path("/run/media/mmcblk0p1/steamapps/common/Football Manager 26"),
+        ("fm_Data/StreamingAssets/aa/StandaloneLinux64",),
+    ),
+)
+
+_MAIN_QSS = """
+    QGroupBox {
+        border: 1px solid #555;
+        border-radius: 3px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+"""
+
+_SAVE_BUTTON_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        font-weight: bold;
+        font-size: 13px;
+        padding: 6px 14px;
+        border: none;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:pressed {
+        background-color: #3d8b40;
+    }
+    QPushButton:disabled {
+        background-color: #666;
+        color: #999;
+    }
+"""
+
+# Whether this is a PyInstaller build; fixed for the life of the process
+_FROZEN = bool(getattr(sys, 'frozen', False))
+
+# The build spec bundles a single icon next to the executable: .ico on Windows, .png elsewhere
+_FROZEN_ICON = (os.path.join(os.path.dirname(sys.executable),
+                             "icon.ico" if sys.platform.startswith("win") else "icon.png")
+                if _FROZEN else None)
+
+# Icon locations when running from source, joined once at import
+_SOURCE_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+_SOURCE_CANDIDATES = (
+    ("icon.ico", os.path.join(_SOURCE_DIR, "icon.ico")),
+    ("icon.png", os.path.join(_SOURCE_DIR, "icon.png")),
+)
+
+
+@lru_cache(maxsize=None)
+def get_icon_path() -> Optional[str]:
+    """Get the path to the icon file, handling both development and PyInstaller builds."""
+    if _FROZEN:
+        return _FROZEN_ICON if os.path.isfile(_FROZEN_ICON) else None
+    
+    # One directory read covers both candidates
+    try:
+        with os.scandir(_SOURCE_DIR) as entries:
+            names = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return None
+    for name, icon_path in _SOURCE_CANDIDATES:
+        if name in names:
+            return icon_path
+    
+    return None
+
+
+class _LoadWarning(Exception):
+    """A load problem the user can fix, reported as a warning rather than an error."""
+    
+    def __init__(self, title: str, message: str):
+        super().__init__(message)
+        self.title = title
+
+
+class _TaskSignals(QObject):
+    """Signals a _BundleTask uses to hand its result back to the GUI thread."""
+    
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+
+
+class _BundleTask(QRunnable):
+    """Runs blocking bundle I/O on the global thread pool."""
+    
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _TaskSignals()
+    
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+
+# NTFS and default APFS match names case-insensitively, so the scan must too
+_CASE_INSENSITIVE_FS = sys.platform.startswith(("win", "darwin"))
+
+
+def _dir_key(name: str) -> str:
+    """Key a directory name the way the platform's filesystem compares names."""
+    return name.casefold() if _CASE_INSENSITIVE_FS else name
+
+
+@lru_cache(maxsize=512)
+def _list_subdirs(path_str: str) -> Dict[str, str]:
+    """Subdirectories of a path, keyed by _dir_key and mapped to their names on disk.
+
+    A single scandir per directory level; DirEntry.is_dir() answers from the
+    cached entry type instead of a stat per candidate. Unreadable or missing
+    directories give an empty mapping. Cleared by MainWindow at the start of each scan.
+    """
+    try:
+        with os.scandir(path_str) as it:
+            return {_dir_key(e.name): e.name for e in it if e.is_dir()}
+    except OSError:
+        return {}
+
+
+def _find_streaming_assets(base: Path, subpaths: Tuple[str, ...]) -> List[Path]:
+    """
+    Find which of the given relative bundle paths exist under an install base.
+
+    Args:
+        base: Install directory to search from
+        subpaths: Candidate relative paths, e.g. "fm_Data/StreamingAssets/aa/StandaloneWindows64"
+
+    Returns:
+        List of the existing candidate paths, in the order given, spelled as they are on disk
+    """
+    found = []
+    for sub in subpaths:
+        current = base
+        for part in sub.split("/"):
+            name = _list_subdirs(str(current)).get(_dir_key(part))
+            if name is None:
+                break
+            current = current / name
+        else:
+            found.append(current)
+    return found
+
+
+def _steam_library_paths() -> List[Path]:
+    """
+    Get the Steam library folders configured on Windows.
+    
+    Reads the Steam install path from the registry, then the extra library
+    folders listed in its steamapps/libraryfolders.vdf.
+    
+    Returns:
+        List of library root paths, or an empty list if Steam is not registered
+    """
+    try:
+        import winreg
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Valve\Steam") as key:
+            steam_path = Path(winreg.QueryValueEx(key, "SteamPath")[0])
+    except (ImportError, OSError):
+        return []
+    
+    libraries = [steam_path]
+    try:
+        with open(steam_path / "steamapps" / "libraryfolders.vdf", encoding="utf-8") as f:
+            for line in f:
+                match = _VDF_PATH_RE.search(line)
+                if match:
+                    library = Path(match.group(1).replace("\\\\", "\\"))
+                    if library not in libraries:
+                        libraries.append(library)
+    except OSError:
+        pass
+    return libraries
+
+
+def _epic_install_paths() -> List[Path]:
+    """
+    Get Football Manager 26 install folders recorded by the Epic Games Launcher.
+    
+    Returns:
+        List of install paths, or an empty list if the launcher manifest is missing
+    """
+    manifest = (
+        Path(os.getenv("PROGRAMDATA", "C:/ProgramData"))
+        / "Epic/UnrealEngineLauncher/LauncherInstalled.dat"
+    )
+    try:
+        with open(manifest, encoding="utf-8") as f:
+            installs = json.load(f).get("InstallationList", [])
+    except (OSError, ValueError, AttributeError):
+        return []
+    
+    paths = []
+    for install in installs:
+        location = install.get("InstallLocation") if isinstance(install, dict) else None
+        if location and Path(location).name.replace(" ", "").lower() == "footballmanager26":
+            paths.append(Path(location))
+    return paths
 
 
 def scan_for_fm_directories() -> List[Path]:
@@ -23,63 +281,29 @@ def scan_for_fm_directories() -> List[Path]:
     Returns:
         List of discovered bundle directory paths (full paths including StreamingAssets)
     """
-    home = Path.home()
-    out = []
+    searches: List[Tuple[Path, Tuple[str, ...]]] = []
     
     if sys.platform.startswith("win"):
-        steam = (
-            Path(os.getenv("PROGRAMFILES(X86)", "C:/Program Files (x86)"))
-            / "Steam/steamapps/common/Football Manager 26"
-        )
-        epic = (
-            Path(os.getenv("PROGRAMFILES", "C:/Program Files"))
-            / "Epic Games/Football Manager 26"
-        )
-        for base in (steam, epic):
-            for sub in (
-                "fm_Data/StreamingAssets/aa/StandaloneWindows64",
-                "data/StreamingAssets/aa/StandaloneWindows64",
-            ):
-                p = base / sub
-                if p.exists():
-                    out.append(p)
-        
-        # Xbox Game Pass - check C:, D:, E: drives
-        for drive in ("C:", "D:", "E:"):
-            gamepass_base = Path(f"{drive}/XboxGames/Football Manager 26/Content")
-            if gamepass_base.exists():
-                for sub in (
-                    "fm_Data/StreamingAssets/aa/StandaloneWindows64",
-                    "data/StreamingAssets/aa/StandaloneWindows64",
-                ):
-                    p = gamepass_base / sub
-                    if p.exists():
-                        out.append(p)
-    
-    elif sys.platform.startswith("darwin"):
-        # macOS
-        for p in (
-            home
-            / "Library/Application Support/Steam/steamapps/common/Football Manager 26/fm.app/Contents/Resources/Data/StreamingAssets/aa/StandaloneOSX",
-            home
-            / "Library/Application Support/Steam/steamapps/common/Football Manager 26/fm_Data/StreamingAssets/aa/StandaloneOSXUniversal",
-            home
-            / "Library/Application Support/Epic/Football Manager 26/fm_Data/StreamingAssets/aa/StandaloneOSXUniversal",
-        ):
-            if p.exists():
-                out.append(p)
+        steam_bases = [
+            library / "steamapps/common/Football Manager 26"
+            for library in _steam_library_paths()
+        ] or [_WIN_STEAM_FALLBACK]
+        epic_bases = _epic_install_paths() or [_WIN_EPIC_FALLBACK]
+        for base in (*steam_bases, *epic_bases, *_XBOX_BASES):
+            searches.append((base, _WIN_SUBPATHS))
     
     else:
-        # Linux/Steam Deck
-        linux_paths = [
-            home / ".local/share/Steam/steamapps/common/Football Manager 26/fm_Data/StreamingAssets/aa/StandaloneLinux64",
-            Path("/run/media/mmcblk0p1/steamapps/common/Football Manager 26/fm_Data/StreamingAssets/aa/StandaloneLinux64"),
-        ]
-        for p in linux_paths:
-            if p.exists():
-                out.append(p)
+        # macOS, or Linux/Steam Deck
+        home = Path.home()
+        platform_searches = _MAC_SEARCHES if sys.platform.startswith("darwin") else _LINUX_SEARCHES
+        for base, subpaths in platform_searches:
+            searches.append((home / base, subpaths))
     
-    return out
+    # Each install location is probed independently, so a sleeping drive only
+    # delays its own probe; map() keeps the results in search order.
+    with ThreadPoolExecutor(max_workers=min(8, len(searches))) as executor:
+        results = executor.map(lambda search: _find_streaming_assets(*search), searches)
+        return [path for found in results for path in found]
 
 
 class MainWindow(QMainWindow):
@@ -89,9 +313,10 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.fm_install_dir: Optional[str] = None
         self.bundle_dir_path: Optional[str] = None
-        self.bundle_manager: Optional[BundleManager] = None
-        self.backup_manager: Optional[BackupManager] = None
-        self.data_parser = DataParser()
+        self.bundle_manager: Optional["BundleManager"] = None
+        self.backup_manager: Optional["BackupManager"] = None
+        self._data_parser: Optional["DataParser"] = None
+        self.threshold_editor: Optional["ThresholdEditor"] = None
         
         # Data storage
         self.attribute_data: Optional[Dict[str, Any]] = None
@@ -102,25 +327,35 @@ class MainWindow(QMainWindow):
         self.colors: list = [] 
         self.highlight_data_collection: Optional[Dict[str, Any]] = None
         self.highlight_no_border_collection: Optional[Dict[str, Any]] = None
+        self._default_preset_obj: Optional[Dict[str, Any]] = None
+        self._original_unset_low_rgba: list = []
+        self._data_bundle_name: Optional[str] = None
+        self._style_bundle_name: Optional[str] = None
+        self._task: Optional[_BundleTask] = None
+        self._initial_highlight_enabled: Optional[bool] = None
+        self._saving_highlight_enabled: Optional[bool] = None
+        
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(self._adjust_window_size)
         
         self._init_ui()
+        QTimer.singleShot(0, self._apply_window_icon)
     
-    def _get_icon_path(self):
-        """Get the path to the icon file, handling both development and PyInstaller builds."""
-        if getattr(sys, 'frozen', False):
-            base_path = Path(sys.executable).parent
-        else:
-            base_path = Path(__file__).parent.parent
-        
-        icon_path = base_path / "icon.ico"
-        if icon_path.exists():
-            return str(icon_path)
-        
-        icon_path = base_path / "icon.png"
-        if icon_path.exists():
-            return str(icon_path)
-        
-        return None
+    @property
+    def data_parser(self) -> "DataParser":
+        """Bundle data parser, created on first use."""
+        if self._data_parser is None:
+            from data_parser import DataParser
+            self._data_parser = DataParser()
+        return self._data_parser
+    
+    def _apply_window_icon(self):
+        """Set the window icon once the event loop is running, keeping the decode off the first paint."""
+        icon_path = get_icon_path()
+        if icon_path:
+            self.setWindowIcon(QIcon(icon_path))
     
     def _init_ui(self):
         """Initialize the UI."""
@@ -128,22 +363,7 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(460, 180)
         self.resize(460, 180)
         
-        icon_path = self._get_icon_path()
-        if icon_path:
-            self.setWindowIcon(QIcon(icon_path))
-        self.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #555;
-                border-radius: 3px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        self.setStyleSheet(_MAIN_QSS)
         
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -174,13 +394,9 @@ class MainWindow(QMainWindow):
         self.content_widget = QWidget()
         content_layout = QVBoxLayout()
         
-        self.threshold_editor = ThresholdEditor([], [], [])
-        self.threshold_editor.thresholdsChanged.connect(self._on_thresholds_changed)
-        self.threshold_editor.colorsChanged.connect(self._on_colors_changed)
-        self.threshold_editor.rowAdded.connect(self._on_add_row_requested)
-        self.threshold_editor.rowRemoved.connect(self._on_remove_row_requested)
-        self.threshold_editor.rowCountChanged.connect(self._on_row_count_changed)
-        content_layout.addWidget(self.threshold_editor)
+        # Swapped for the ThresholdEditor by _ensure_threshold_editor on first load
+        self._editor_placeholder = QWidget()
+        content_layout.addWidget(self._editor_placeholder)
         
         highlight_group = QGroupBox("Attribute Highlighting")
         highlight_layout = QVBoxLayout()
@@ -207,27 +423,7 @@ class MainWindow(QMainWindow):
         self.save_button.setEnabled(False)
         self.save_button.setMinimumHeight(36)
         self.save_button.setMinimumWidth(120)
-        self.save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-weight: bold;
-                font-size: 13px;
-                padding: 6px 14px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QPushButton:disabled {
-                background-color: #666;
-                color: #999;
-            }
-        """)
+        self.save_button.setStyleSheet(_SAVE_BUTTON_QSS)
         self.save_button.clicked.connect(self._save_changes)
         self.save_button.hide()
         self.button_layout.addWidget(self.save_button)
@@ -239,12 +435,52 @@ class MainWindow(QMainWindow):
         self.content_widget.hide()
         main_layout.addWidget(self.content_widget)
         
+        self.busy_indicator = QProgressBar()
+        self.busy_indicator.setRange(0, 0)
+        self.busy_indicator.setMaximumWidth(120)
+        self.busy_indicator.hide()
+        self.statusBar().addPermanentWidget(self.busy_indicator)
+        
         self.statusBar().showMessage("Ready - Select FM installation directory to begin")
     
+    def _start_task(self, task: _BundleTask, on_finished, on_failed):
+        """Run a bundle task on the thread pool, locking the controls until it reports back."""
+        self._task = task
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(on_failed)
+        self._set_busy(True)
+        QThreadPool.globalInstance().start(task)
+    
+    def _finish_task(self):
+        """Release the running task and unlock the controls."""
+        self._task = None
+        self._set_busy(False)
+    
+    def _set_busy(self, busy: bool):
+        """Enable or disable the controls that start bundle I/O."""
+        self.busy_indicator.setVisible(busy)
+        self.scan_dir_button.setEnabled(not busy)
+        self.select_dir_button.setEnabled(not busy)
+        loaded = self.bundle_manager is not None
+        # Edits made while a save runs would not be written, so the editor is locked too
+        self.content_widget.setEnabled(not busy and loaded)
+        self.save_button.setEnabled(not busy and loaded)
+        self.restore_button.setEnabled(not busy and loaded)
+    
+    def closeEvent(self, event):
+        """Keep the window open while a bundle task runs so a write is never cut off mid-file."""
+        if self._task is not None:
+            event.ignore()
+            self.statusBar().showMessage("Please wait for the current operation to finish before closing")
+            return
+        super().closeEvent(event)
+    
     def _scan_directory(self):
         """Scan for Football Manager 26 directories automatically."""
         self.statusBar().showMessage("Scanning for FM26 directories...")
         
+        # Each click is a fresh look at the disk; listings are only shared within one scan
+        _list_subdirs.cache_clear()
         candidates = scan_for_fm_directories()
         
         if not candidates:
@@ -308,14 +544,13 @@ class MainWindow(QMainWindow):
         Returns:
             Base installation directory path, or None if not found
         """
-        current = bundle_dir
-        for _ in range(10):
-            if current.name == "Football Manager 26":
-                return current
-            if current.parent == current:
-                break
-            current = current.parent
-        return None
+        parts = bundle_dir.parts
+        try:
+            # Nearest match to the bundle dir, as when walking up the parents
+            idx = len(parts) - 1 - parts[::-1].index("Football Manager 26")
+        except ValueError:
+            return None
+        return Path(*parts[:idx + 1])
     
     def _select_directory(self):
         """Open directory selection dialog."""
@@ -337,66 +572,112 @@ class MainWindow(QMainWindow):
         if not self.fm_install_dir:
             return
         
-        try:
-            self.statusBar().showMessage("Loading bundle files...")
-            if self.bundle_dir_path:
-                self.bundle_manager = BundleManager(self.fm_install_dir, bundle_dir_path=self.bundle_dir_path)
-            else:
-                self.bundle_manager = BundleManager(self.fm_install_dir)
-            self.backup_manager = BackupManager(self.bundle_manager.bundle_dir)
-            
-            if not self.bundle_manager.bundle_dir.exists():
-                QMessageBox.warning(
-                    self,
-                    "Directory Not Found",
-                    f"Bundle directory not found:\n{self.bundle_manager.bundle_dir}\n\n"
-                    "Please ensure you selected the correct FM installation directory."
-                )
-                return
-            
-            data_bundle_name = self.bundle_manager.get_data_collection_bundle_name()
-            if not self.bundle_manager.bundle_exists(data_bundle_name):
-                QMessageBox.warning(
-                    self,
-                    "Bundle Not Found",
-                    f"Data bundle not found: {data_bundle_name}"
-                )
-                return
-            
-            attr_data_obj = self.bundle_manager.get_object_from_bundle(
-                data_bundle_name,
-                "AttributeDataCollection"
+        self.statusBar().showMessage("Loading bundle files...")
+        self._start_task(
+            _BundleTask(self._read_bundle_data, self.fm_install_dir, self.bundle_dir_path),
+            self._on_data_loaded,
+            self._on_load_failed
+        )
+    
+    def _read_bundle_data(self, fm_install_dir: str, bundle_dir_path: Optional[str]) -> Dict[str, Any]:
+        """
+        Read and parse everything the editor needs from the bundles.
+        
+        Runs on the thread pool, so it must not touch any widgets.
+        
+        Returns:
+            Dictionary of managers, raw bundle objects and parsed rows
+        """
+        from bundle_manager import BundleManager
+        from backup_manager import BackupManager
+        
+        if bundle_dir_path:
+            bundle_manager = BundleManager(fm_install_dir, bundle_dir_path=bundle_dir_path)
+        else:
+            bundle_manager = BundleManager(fm_install_dir)
+        backup_manager = BackupManager(bundle_manager.bundle_dir)
+        
+        if not bundle_manager.bundle_dir.exists():
+            raise _LoadWarning(
+                "Directory Not Found",
+                f"Bundle directory not found:\n{bundle_manager.bundle_dir}\n\n"
+                "Please ensure you selected the correct FM installation directory."
             )
-            
-            if attr_data_obj is None:
-                QMessageBox.warning(
-                    self,
-                    "Data Not Found",
-                    "AttributeDataCollection not found in bundle"
-                )
-                return
-            
-            self.statusBar().showMessage("Checking backups...")
-            data_bundle_name = self.bundle_manager.get_data_collection_bundle_name()
-            style_bundle_name = self.bundle_manager.get_style_bundle_name()
-            
-            data_bundle_path = self.bundle_manager.get_bundle_path(data_bundle_name)
-            style_bundle_path = self.bundle_manager.get_bundle_path(style_bundle_name)
-            
-            backup_paths, created = self.backup_manager.create_backups([data_bundle_path, style_bundle_path], original=True)
-            if created:
+        
+        data_bundle_name = bundle_manager.get_data_collection_bundle_name()
+        style_bundle_name = bundle_manager.get_style_bundle_name()
+        if not bundle_manager.bundle_exists(data_bundle_name):
+            raise _LoadWarning("Bundle Not Found", f"Data bundle not found: {data_bundle_name}")
+        
+        data_bundle_objects = bundle_manager.get_objects_from_bundle(
+            data_bundle_name,
+            [
+                "AttributeDataCollection",
+                "AttributeHighlightTypeDataCollection",
+                "AttributeHighlightTypeNoBorderDataCollection",
+            ]
+        )
+        attr_data_obj = data_bundle_objects["AttributeDataCollection"]
+        
+        if attr_data_obj is None:
+            raise _LoadWarning("Data Not Found", "AttributeDataCollection not found in bundle")
+        
+        data_bundle_path = bundle_manager.get_bundle_path(data_bundle_name)
+        style_bundle_path = bundle_manager.get_bundle_path(style_bundle_name)
+        
+        backup_paths, created = backup_manager.create_backups([data_bundle_path, style_bundle_path], original=True)
+        
+        parsed = self.data_parser.parse_attribute_data_collection(attr_data_obj)
+        
+        default_preset_obj = bundle_manager.get_object_from_bundle(
+            style_bundle_name,
+            "AttributeColoursDefault"
+        )
+        colors_rgba = self.data_parser.extract_colors_from_rules(default_preset_obj) if default_preset_obj else []
+        
+        highlight_data_collection = data_bundle_objects["AttributeHighlightTypeDataCollection"]
+        highlight_no_border_collection = data_bundle_objects["AttributeHighlightTypeNoBorderDataCollection"]
+        highlight_style_classes = (
+            self.data_parser.parse_attribute_highlight_collection(highlight_data_collection)
+            if highlight_data_collection else []
+        )
+        
+        return {
+            'bundle_manager': bundle_manager,
+            'backup_manager': backup_manager,
+            'backups_created': created,
+            'data_bundle_name': data_bundle_name,
+            'style_bundle_name': style_bundle_name,
+            'attribute_data': attr_data_obj,
+            'thresholds': parsed['thresholds'],
+            'style_classes': parsed['style_classes'],
+            'default_preset_obj': default_preset_obj,
+            'colors_rgba': colors_rgba,
+            'highlight_data_collection': highlight_data_collection,
+            'highlight_no_border_collection': highlight_no_border_collection,
+            'highlight_style_classes': highlight_style_classes,
+        }
+    
+    def _on_data_loaded(self, result: Dict[str, Any]):
+        """Apply bundle data read by _read_bundle_data to the window and editor."""
+        self._finish_task()
+        try:
+            self.bundle_manager = result['bundle_manager']
+            self.backup_manager = result['backup_manager']
+            self._data_bundle_name = result['data_bundle_name']
+            self._style_bundle_name = result['style_bundle_name']
+            if result['backups_created']:
                 self.statusBar().showMessage("Original backups created, loading data...")
             else:
                 self.statusBar().showMessage("Loading data...")
             
-            self.attribute_data = attr_data_obj
+            self.attribute_data = result['attribute_data']
+            all_thresholds = result['thresholds']
+            all_style_classes = result['style_classes']
             
-            parsed = self.data_parser.parse_attribute_data_collection(attr_data_obj)
-            all_thresholds = parsed['thresholds']
-            all_style_classes = parsed['style_classes']
-            
-            self.all_thresholds = all_thresholds
-            self.all_style_classes = all_style_classes
+            # Own copies: these are edited in place and must not alias the parsed bundle rows
+            self.all_thresholds = list(all_thresholds)
+            self.all_style_classes = list(all_style_classes)
             
             if len(all_style_classes) >= 2:
                 self.thresholds = all_thresholds[2:]
@@ -405,48 +686,35 @@ class MainWindow(QMainWindow):
                 self.thresholds = all_thresholds
                 self.style_classes = all_style_classes
             
-            style_bundle_name = self.bundle_manager.get_style_bundle_name()
-            default_preset_obj = self.bundle_manager.get_object_from_bundle(
-                style_bundle_name,
-                "AttributeColoursDefault"
-            )
+            default_preset_obj = result['default_preset_obj']
             
+            self._default_preset_obj = default_preset_obj
             if default_preset_obj:
-                colors_rgba = self.data_parser.extract_colors_from_rules(default_preset_obj)
+                colors_rgba = result['colors_rgba']
+                self._original_unset_low_rgba = colors_rgba[:2] if len(colors_rgba) >= 2 else []
                 
-                colors_hex = []
-                for rgba in colors_rgba:
-                    if len(rgba) >= 3:
-                        hex_color = self.data_parser.rgba_to_hex(*rgba)
-                        colors_hex.append(hex_color)
-                    else:
-                        colors_hex.append("#FFFFFF")
+                colors_hex = self.data_parser.rgba_list_to_hex(colors_rgba)
                 
                 if len(colors_hex) >= 2:
                     display_colors_hex = colors_hex[2:]
                 else:
                     display_colors_hex = colors_hex
                 
-                while len(display_colors_hex) < len(self.style_classes):
-                    display_colors_hex.append("#FFFFFF")
-                
-                self.colors = display_colors_hex[:len(self.style_classes)]
+                pad = len(self.style_classes) - len(display_colors_hex)
+                if pad > 0:
+                    self.colors = display_colors_hex + ["#FFFFFF"] * pad
+                else:
+                    self.colors = display_colors_hex[:len(self.style_classes)]
             else:
+                self._original_unset_low_rgba = []
                 self.colors = ["#FFFFFF"] * len(self.style_classes)
-            data_bundle_name = self.bundle_manager.get_data_collection_bundle_name()
-            self.highlight_data_collection = self.bundle_manager.get_object_from_bundle(
-                data_bundle_name,
-                "AttributeHighlightTypeDataCollection"
-            )
-            self.highlight_no_border_collection = self.bundle_manager.get_object_from_bundle(
-                data_bundle_name,
-                "AttributeHighlightTypeNoBorderDataCollection"
-            )
+            self.highlight_data_collection = result['highlight_data_collection']
+            self.highlight_no_border_collection = result['highlight_no_border_collection']
             
             if self.highlight_data_collection:
-                style_classes = self.data_parser.parse_attribute_highlight_collection(self.highlight_data_collection)
+                style_classes = result['highlight_style_classes']
                 if len(style_classes) >= 3:
-                    if style_classes[0] == style_classes[1] == style_classes[2] == "attributes-row-number":
+                    if tuple(style_classes[:3]) == _ROW_NUMBER_TRIPLE:
                         self.highlight_checkbox.setChecked(False)
                     else:
                         self.highlight_checkbox.setChecked(True)
@@ -454,26 +722,14 @@ class MainWindow(QMainWindow):
                     self.highlight_checkbox.setChecked(True)
             else:
                 self.highlight_checkbox.setChecked(True)
+            self._initial_highlight_enabled = self.highlight_checkbox.isChecked()
             
+            self._ensure_threshold_editor()
             if self.threshold_editor:
-                try:
-                    self.threshold_editor.thresholdsChanged.disconnect()
-                    self.threshold_editor.colorsChanged.disconnect()
-                    self.threshold_editor.rowAdded.disconnect()
-                    self.threshold_editor.rowRemoved.disconnect()
-                    self.threshold_editor.rowCountChanged.disconnect()
-                except:
-                    pass
-                self.threshold_editor.thresholdsChanged.connect(self._on_thresholds_changed)
-                self.threshold_editor.colorsChanged.connect(self._on_colors_changed)
-                self.threshold_editor.rowAdded.connect(self._on_add_row_requested)
-                self.threshold_editor.rowRemoved.connect(self._on_remove_row_requested)
-                self.threshold_editor.rowCountChanged.connect(self._on_row_count_changed)
-                self.threshold_editor.thresholds = self.thresholds.copy()
-                self.threshold_editor.style_classes = self.style_classes.copy()
-                self.threshold_editor.colors = self.colors.copy()
-                self.threshold_editor.set_thresholds(self.thresholds)
-                self.threshold_editor.set_colors(self.colors)
+                # Window state is already up to date, so the editor's change signals
+                # would only echo it back while the rows are rebuilt.
+                with QSignalBlocker(self.threshold_editor):
+                    self.threshold_editor.initialize(self.thresholds, self.style_classes, self.colors)
             
             self.content_widget.show()
             self.content_widget.setEnabled(True)
@@ -488,25 +744,50 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage("Data loaded successfully")
             
         except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to load data:\n{str(e)}"
-            )
-            self.statusBar().showMessage("Error loading data")
+            self._on_load_failed(e)
+    
+    def _ensure_threshold_editor(self):
+        """Create the threshold editor in place of its placeholder the first time data is loaded."""
+        if self.threshold_editor is not None:
+            return
+        from gui.threshold_editor import ThresholdEditor
+        
+        self.threshold_editor = ThresholdEditor([], [], [])
+        self.threshold_editor.thresholdsChanged.connect(self._on_thresholds_changed)
+        self.threshold_editor.colorsChanged.connect(self._on_colors_changed)
+        self.threshold_editor.rowAdded.connect(self._on_add_row_requested)
+        self.threshold_editor.rowRemoved.connect(self._on_remove_row_requested)
+        self.threshold_editor.rowCountChanged.connect(self._on_row_count_changed)
+        self.content_widget.layout().replaceWidget(self._editor_placeholder, self.threshold_editor)
+        self._editor_placeholder.deleteLater()
+        self._editor_placeholder = None
+    
+    def _on_load_failed(self, error: Exception):
+        """Report a failed load."""
+        self._finish_task()
+        if isinstance(error, _LoadWarning):
+            QMessageBox.warning(self, error.title, str(error))
+            return
+        
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Failed to load data:\n{str(error)}"
+        )
+        self.statusBar().showMessage("Error loading data")
     
     def _on_thresholds_changed(self, thresholds: list):
         """Handle threshold changes."""
         self.thresholds = thresholds
         if len(self.all_thresholds) >= 2:
-            self.all_thresholds = self.all_thresholds[:2] + thresholds
+            self.all_thresholds[2:] = thresholds
         else:
-            self.all_thresholds = thresholds
+            self.all_thresholds = list(thresholds)
         
         if len(self.all_style_classes) >= 2:
-            self.all_style_classes = self.all_style_classes[:2] + self.style_classes
+            self.all_style_classes[2:] = self.style_classes
         else:
-            self.all_style_classes = self.style_classes
+            self.all_style_classes = list(self.style_classes)
         
         self.statusBar().showMessage("Thresholds updated")
     
@@ -525,14 +806,10 @@ class MainWindow(QMainWindow):
         
         new_threshold = 19
         
-        max_custom_num = 0
-        for style_class in self.style_classes:
-            if style_class.startswith("attribute-colour-custom-"):
-                try:
-                    num = int(style_class.split("-")[-1])
-                    max_custom_num = max(max_custom_num, num)
-                except:
-                    pass
+        max_custom_num = max(
+            (int(m.group(1)) for s in self.style_classes if (m := _CUSTOM_RE.match(s))),
+            default=0
+        )
         
         new_style_class = f"attribute-colour-custom-{max_custom_num + 1}"
         
@@ -556,18 +833,14 @@ class MainWindow(QMainWindow):
             editor_insert_index = 0
         
         self.threshold_editor.add_row_at_index(editor_insert_index, new_threshold, new_style_class, new_color)
+        self._sync_from_editor()
         
-        self.thresholds = self.threshold_editor.thresholds.copy()
-        self.style_classes = self.threshold_editor.style_classes.copy()
-        self.colors = self.threshold_editor.colors.copy()
-        
-        all_insert_index = editor_insert_index + 2
         if len(self.all_thresholds) >= 2:
-            self.all_thresholds = self.all_thresholds[:2] + self.thresholds
-            self.all_style_classes = self.all_style_classes[:2] + self.style_classes
+            self.all_thresholds[2:] = self.thresholds
+            self.all_style_classes[2:] = self.style_classes
         else:
-            self.all_thresholds = self.thresholds.copy()
-            self.all_style_classes = self.style_classes.copy()
+            self.all_thresholds = list(self.thresholds)
+            self.all_style_classes = list(self.style_classes)
     
     def _on_remove_row_requested(self, index: int):
         """Handle request to remove a row at the given index."""
@@ -586,8 +859,13 @@ class MainWindow(QMainWindow):
         self.all_style_classes.pop(all_index)
         
         self.threshold_editor.remove_row_at_index(index)
-        self.threshold_editor.set_colors(self.colors)
-        self.threshold_editor.style_classes = self.style_classes.copy()
+        self._sync_from_editor()
+    
+    def _sync_from_editor(self):
+        """Copy the editor's row data back after it has added or removed a row."""
+        self.thresholds = self.threshold_editor.get_thresholds()
+        self.style_classes = self.threshold_editor.get_style_classes()
+        self.colors = list(self.threshold_editor.colors)
     
     def _adjust_window_size(self):
         """Adjust window size to accommodate content."""
@@ -603,11 +881,14 @@ class MainWindow(QMainWindow):
         current_height = self.height()
         if new_height > current_height:
             self.resize(self.width(), new_height)
-        self.setMinimumHeight(min(new_height, 800))
+        
+        new_min_height = min(new_height, 800)
+        if new_min_height != self.minimumHeight():
+            self.setMinimumHeight(new_min_height)
     
     def _on_row_count_changed(self):
         """Handle row count change - resize window to accommodate rows."""
-        self._adjust_window_size()
+        self._resize_timer.start()
     
     def _save_changes(self):
         """Save changes to bundle files."""
@@ -628,12 +909,6 @@ class MainWindow(QMainWindow):
         try:
             self.statusBar().showMessage("Saving changes...")
             
-            data_bundle_name = self.bundle_manager.get_data_collection_bundle_name()
-            style_bundle_name = self.bundle_manager.get_style_bundle_name()
-            
-            data_bundle_path = self.bundle_manager.get_bundle_path(data_bundle_name)
-            style_bundle_path = self.bundle_manager.get_bundle_path(style_bundle_name)
-            
             updated_attr_data = self.data_parser.update_attribute_data_collection(
                 self.attribute_data if self.attribute_data else {},
                 self.all_thresholds,
@@ -644,20 +919,15 @@ class MainWindow(QMainWindow):
                 "AttributeDataCollection": updated_attr_data
             }
             
-            default_preset_obj = self.bundle_manager.get_object_from_bundle(
-                style_bundle_name,
-                "AttributeColoursDefault"
-            )
+            default_preset_obj = self._default_preset_obj
             
             style_objects = {}
             if default_preset_obj:
-                editable_colors_hex = self.colors
-                editable_colors_rgba = []
-                for hex_color in editable_colors_hex:
-                    rgba = self.data_parser.hex_to_rgba(hex_color)
-                    editable_colors_rgba.append(rgba)
+                editable_colors_rgba = self.data_parser.hex_list_to_rgba(self.colors)
                 
-                original_colors_rgba = self.data_parser.extract_colors_from_rules(default_preset_obj)
+                original_colors_rgba = self._original_unset_low_rgba
+                if not original_colors_rgba:
+                    original_colors_rgba = self.data_parser.extract_colors_from_rules(default_preset_obj)
                 
                 if len(original_colors_rgba) >= 2:
                     full_colors_rgba = original_colors_rgba[:2] + editable_colors_rgba
@@ -672,8 +942,10 @@ class MainWindow(QMainWindow):
                 
                 style_objects["AttributeColoursDefault"] = updated_preset
             
-            if self.highlight_data_collection:
-                highlight_enabled = self.highlight_checkbox.isChecked()
+            highlight_enabled = self.highlight_checkbox.isChecked()
+            highlight_changed = highlight_enabled != self._initial_highlight_enabled
+            
+            if highlight_changed and self.highlight_data_collection:
                 updated_highlight_data = self.data_parser.update_attribute_highlight_collection(
                     self.highlight_data_collection,
                     highlight_enabled,
@@ -681,8 +953,7 @@ class MainWindow(QMainWindow):
                 )
                 data_objects["AttributeHighlightTypeDataCollection"] = updated_highlight_data
             
-            if self.highlight_no_border_collection:
-                highlight_enabled = self.highlight_checkbox.isChecked()
+            if highlight_changed and self.highlight_no_border_collection:
                 updated_highlight_no_border = self.data_parser.update_attribute_highlight_collection(
                     self.highlight_no_border_collection,
                     highlight_enabled,
@@ -690,53 +961,75 @@ class MainWindow(QMainWindow):
                 )
                 data_objects["AttributeHighlightTypeNoBorderDataCollection"] = updated_highlight_no_border
             
-            self.bundle_manager.write_bundle(data_bundle_name, data_objects)
-            if style_objects:
-                self.bundle_manager.write_bundle(style_bundle_name, style_objects)
-            
-            QMessageBox.information(
-                self,
-                "Save Complete",
-                "Changes saved successfully!"
-            )
-            
-            self.statusBar().showMessage("Changes saved successfully")
-            
         except Exception as e:
-            error_dialog = QDialog(self)
-            error_dialog.setWindowTitle("Save Error")
-            error_dialog.setMinimumSize(600, 400)
-            
-            layout = QVBoxLayout(error_dialog)
-            
-            label = QLabel("Failed to save changes:")
-            layout.addWidget(label)
-            
-            text_edit = QTextEdit()
-            text_edit.setReadOnly(True)
-            text_edit.setPlainText(str(e))
-            text_edit.setFontFamily("Courier")
-            layout.addWidget(text_edit)
-            
-            button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
-            button_box.accepted.connect(error_dialog.accept)
-            layout.addWidget(button_box)
-            
-            error_dialog.exec()
-            self.statusBar().showMessage("Error saving changes")
+            self._on_save_failed(e)
+            return
+        
+        self._saving_highlight_enabled = highlight_enabled
+        self._start_task(
+            _BundleTask(self._write_bundles, self.bundle_manager, self._data_bundle_name, data_objects,
+                        self._style_bundle_name, style_objects),
+            self._on_save_finished,
+            self._on_save_failed
+        )
+    
+    @staticmethod
+    def _write_bundles(bundle_manager: "BundleManager", data_bundle_name: str, data_objects: Dict[str, Any],
+                       style_bundle_name: str, style_objects: Dict[str, Any]):
+        """Write the updated objects back to their bundles. Runs on the thread pool."""
+        bundle_manager.write_bundle(data_bundle_name, data_objects)
+        if style_objects:
+            bundle_manager.write_bundle(style_bundle_name, style_objects)
+    
+    def _on_save_finished(self, result):
+        """Report a completed save."""
+        self._finish_task()
+        self._initial_highlight_enabled = self._saving_highlight_enabled
+        QMessageBox.information(
+            self,
+            "Save Complete",
+            "Changes saved successfully!"
+        )
+        
+        self.statusBar().showMessage("Changes saved successfully")
+    
+    def _on_save_failed(self, error: Exception):
+        """Show the full save error in a scrollable dialog."""
+        self._finish_task()
+        error_dialog = QDialog(self)
+        error_dialog.setWindowTitle("Save Error")
+        error_dialog.setMinimumSize(600, 400)
+        
+        layout = QVBoxLayout(error_dialog)
+        
+        label = QLabel("Failed to save changes:")
+        layout.addWidget(label)
+        
+        text_edit = QTextEdit()
+        text_edit.setReadOnly(True)
+        text_edit.setPlainText(str(error))
+        text_edit.setFontFamily("Courier")
+        layout.addWidget(text_edit)
+        
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok)
+        button_box.accepted.connect(error_dialog.accept)
+        layout.addWidget(button_box)
+        
+        error_dialog.exec()
+        self.statusBar().showMessage("Error saving changes")
     
     def _restore_backup(self):
         """Restore from original backup."""
         if not self.backup_manager:
             return
         
-        data_bundle_name = self.bundle_manager.get_data_collection_bundle_name()
-        style_bundle_name = self.bundle_manager.get_style_bundle_name()
+        data_bundle_name = self._data_bundle_name
+        style_bundle_name = self._style_bundle_name
         
         data_original = self.backup_manager.get_original_backup(data_bundle_name)
         style_original = self.backup_manager.get_original_backup(style_bundle_name)
         
-        if not data_original and not style_original:
+        if not (data_original or style_original):
             QMessageBox.information(
                 self,
                 "No Original Backups",
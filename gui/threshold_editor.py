@@ -1,8 +1,63 @@
 """Combined threshold and color editor widget."""
+from contextlib import contextmanager
+from functools import lru_cache
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QHBoxLayout,
-                             QSpinBox, QGroupBox, QSizePolicy, QPushButton, QColorDialog, QFrame)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor
+                             QSpinBox, QGroupBox, QSizePolicy, QPushButton, QColorDialog)
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer
+from PyQt6.QtGui import QColor, QPainter
+
+# Shared row styling, applied once to the rows container and matched by object name
+_ROWS_QSS = """
+    QPushButton#removeButton {
+        background-color: #3a3a3a;
+        border: 1px solid #555;
+        border-radius: 2px;
+        color: #fff;
+        font-size: 12px;
+        font-weight: bold;
+        padding: 0px;
+    }
+    QPushButton#removeButton:hover {
+        background-color: #cc0000;
+        border-color: #ff0000;
+    }
+    QPushButton#removeButton:pressed {
+        background-color: #990000;
+    }
+    QLabel#minLabel {
+        color: #ccc;
+        background-color: transparent;
+        border: none;
+        padding: 0px;
+    }
+"""
+
+_PREVIEW_TEMPLATE = (
+    "background-color: #0a0f1e; color: rgba({rgba}); border: none; "
+    "border-radius: 4px; font-weight: bold; font-size: 13px;"
+)
+
+# Preview box stylesheets keyed by hex colour, shared by every editor
+_PREVIEW_STYLE_CACHE: dict = {}
+
+
+class _RowsContainer(QWidget):
+    """Container for the editor rows that paints the 1px dividers in the gaps between them."""
+    
+    _DIVIDER_COLOR = QColor("#333")
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        layout = self.layout()
+        if layout is None or layout.count() < 2:
+            return
+        painter = QPainter(self)
+        painter.setPen(self._DIVIDER_COLOR)
+        right = self.width() - 1
+        for k in range(layout.count() - 1):
+            y = layout.itemAt(k).geometry().bottom() + 1
+            painter.drawLine(0, y, right, y)
+        painter.end()
 
 
 class ThresholdEditor(QWidget):
@@ -14,6 +69,15 @@ class ThresholdEditor(QWidget):
     rowRemoved = pyqtSignal(int)
     rowCountChanged = pyqtSignal()
     
+    # Per-row layout values, looked up once rather than through the bindings for every row
+    _SP_PREFERRED = QSizePolicy.Policy.Preferred
+    _SP_FIXED = QSizePolicy.Policy.Fixed
+    _ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+    _ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+    _ROW_MARGINS = (5, 8, 5, 8)
+    # Hidden rows kept for reuse; matches the most rows the editor allows
+    _POOL_SIZE = 18
+    
     def __init__(self, thresholds: list, style_classes: list, colors: list = None, parent=None):
         super().__init__(parent)
         self.thresholds = thresholds.copy()
@@ -23,7 +87,22 @@ class ThresholdEditor(QWidget):
         self.max_spinboxes = []
         self.color_editors = []
         self.row_widgets = []
+        self.row_labels = []
         self.remove_buttons = []
+        self._row_pool: list = []
+        self._color_dialog = None
+        self._add_row_enabled = None
+        # Row count the remove buttons were last updated for; -1 forces the next update
+        self._remove_buttons_row_count = -1
+        self._dirty_signals: set = set()
+        
+        # Spinbox changes are coalesced so a held-down arrow cascades once per tick
+        self._pending_change = None
+        self._throttle = QTimer(self)
+        self._throttle.setSingleShot(True)
+        self._throttle.setInterval(16)
+        self._throttle.timeout.connect(self._flush_pending_change)
+        
         self._init_ui()
     
     def _init_ui(self):
@@ -41,10 +120,12 @@ class ThresholdEditor(QWidget):
         desc.setContentsMargins(0, 0, 0, 0)
         group_layout.addWidget(desc)
         
-        self.rows_container = QWidget(self.thresholds_group)
+        self.rows_container = _RowsContainer(self.thresholds_group)
+        self.rows_container.setStyleSheet(_ROWS_QSS)
         self.rows_layout = QVBoxLayout()
         self.rows_layout.setContentsMargins(0, 0, 0, 0)
-        self.rows_layout.setSpacing(0)
+        # Leaves a 1px gap between rows for the container to draw the divider in
+        self.rows_layout.setSpacing(1)
         self.rows_container.setLayout(self.rows_layout)
         group_layout.addWidget(self.rows_container)
         
@@ -83,140 +164,232 @@ class ThresholdEditor(QWidget):
                 raise TypeError(f"Threshold at index {i} must be a number, got {type(threshold)}: {threshold}")
             if not isinstance(style_class, str):
                 raise TypeError(f"Style class at index {i} must be a string, got {type(style_class)}: {style_class}")
-            if i == 0:
-                min_val = 1
-            else:
-                min_val = int(self.thresholds[i-1]) + 1
-            max_val = int(threshold)
-            is_last = (i == len(self.thresholds) - 1)
-            if is_last:
-                max_val = 20
-                self.thresholds[i] = 20
-            range_text = f"{min_val}-{max_val}"
-            
-            row_widget = QWidget(self.rows_container)
-            row_layout = QHBoxLayout()
-            row_layout.setContentsMargins(5, 8, 5, 8)
-            row_layout.setSpacing(10)
-            
-            range_number = i + 1
-            label = QLabel(f"Range {range_number}", row_widget)
-            label.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
-            row_layout.addWidget(label)
-            
-            removable_count = len(self.thresholds) - 4
-            can_remove_this_row = not is_last and i < removable_count
-            
-            remove_button = None
-            if can_remove_this_row:
-                remove_button = QPushButton("×", row_widget)
-                remove_button.setMinimumWidth(20)
-                remove_button.setMaximumWidth(20)
-                remove_button.setMinimumHeight(20)
-                remove_button.setMaximumHeight(20)
-                remove_button.setToolTip("Remove this range")
-                remove_button.setStyleSheet(
-                    "QPushButton {"
-                    "background-color: #3a3a3a; "
-                    "border: 1px solid #555; "
-                    "border-radius: 2px; "
-                    "color: #fff; "
-                    "font-size: 12px; "
-                    "font-weight: bold; "
-                    "padding: 0px; "
-                    "}"
-                    "QPushButton:hover {"
-                    "background-color: #cc0000; "
-                    "border-color: #ff0000; "
-                    "}"
-                    "QPushButton:pressed {"
-                    "background-color: #990000; "
-                    "}"
-                )
-                remove_button.clicked.connect(lambda checked, idx=i: self._on_remove_row_clicked(idx))
-                self.remove_buttons.append(remove_button)
-                row_layout.addWidget(remove_button)
-            else:
-                self.remove_buttons.append(None)
-            
-            row_layout.addStretch()
-            
-            min_label = QLabel(f"{min_val} - ", row_widget)
-            min_label.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
-            min_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            min_label.setStyleSheet(
-                "QLabel {"
-                "color: #ccc; "
-                "background-color: transparent; "
-                "border: none; "
-                "padding: 0px; "
-                "}"
-            )
-            self.min_labels.append(min_label)
-            row_layout.addWidget(min_label)
-            
-            max_spin = QSpinBox(row_widget)
-            max_spin.setMinimum(1)
-            max_spin.setMaximum(20)
-            max_spin.setValue(max_val)
-            max_spin.setMinimumWidth(60)
-            max_spin.setMaximumWidth(60)
-            max_spin.setMinimumHeight(32)
-            max_spin.setMaximumHeight(32)
-            max_spin.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-            is_last = (i == len(self.thresholds) - 1)
-            if is_last:
-                max_spin.setValue(20)
-                max_spin.setEnabled(False)
-            max_spin.valueChanged.connect(lambda val, idx=i: self._on_max_changed(idx, val))
-            self.max_spinboxes.append(max_spin)
-            row_layout.addWidget(max_spin)
-            
-            color_preview = QLabel(row_widget)
-            color_preview.setMinimumSize(45, 32)
-            color_preview.setMaximumSize(45, 32)
-            color_preview.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-            color_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            color_hex = self.colors[i] if i < len(self.colors) else "#FFFFFF"
-            color_preview.setText(range_text)
-            rgba = self._hex_to_rgba_css(color_hex)
-            color_preview.setStyleSheet(
-                f"background-color: #0a0f1e; "
-                f"color: rgba({rgba}); "
-                f"border: none; "
-                f"border-radius: 4px; "
-                f"font-weight: bold; "
-                f"font-size: 13px;"
-            )
-            row_layout.addWidget(color_preview)
-            
-            pick_button = QPushButton("Edit Colour", row_widget)
-            pick_button.setMinimumWidth(90)
-            pick_button.setMinimumHeight(32)
-            pick_button.setMaximumHeight(32)
-            pick_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-            pick_button.clicked.connect(lambda checked, idx=i, preview=color_preview: self._open_color_picker(idx, preview))
-            row_layout.addWidget(pick_button)
-            
-            self.color_editors.append({
-                'preview': color_preview,
-                'button': pick_button,
-                'color': color_hex,
-                'range_text': range_text
-            })
-            
-            row_widget.setLayout(row_layout)
-            self.rows_layout.addWidget(row_widget)
-            self.row_widgets.append(row_widget)
+            self._insert_row(i)
+    
+    def _new_row(self) -> QWidget:
+        """
+        Construct an empty row: Label - Remove - Min - Max - Preview - Edit Colour.
+        
+        The child widgets are kept as attributes on the row so a pooled row can
+        be refilled by _build_row without looking them up again. Controls connect
+        straight to slots that find their row from sender() when they fire, so
+        the connections survive the row being moved, pooled or reused.
+        
+        Returns:
+            The row widget, parented to rows_container but not in rows_layout
+        """
+        row_widget = QWidget(self.rows_container)
+        row_layout = QHBoxLayout()
+        row_layout.setContentsMargins(*self._ROW_MARGINS)
+        row_layout.setSpacing(10)
+        
+        label = QLabel(row_widget)
+        label.setSizePolicy(self._SP_PREFERRED, self._SP_PREFERRED)
+        row_layout.addWidget(label)
+        
+        # Always created so the row can become removable later; hidden until then
+        remove_button = QPushButton("×", row_widget)
+        remove_button.setMinimumWidth(20)
+        remove_button.setMaximumWidth(20)
+        remove_button.setMinimumHeight(20)
+        remove_button.setMaximumHeight(20)
+        remove_button.setToolTip("Remove this range")
+        remove_button.setObjectName("removeButton")
+        remove_button.clicked.connect(self._on_remove_button_clicked)
+        row_layout.addWidget(remove_button)
+        
+        row_layout.addStretch()
+        
+        min_label = QLabel(row_widget)
+        min_label.setSizePolicy(self._SP_PREFERRED, self._SP_PREFERRED)
+        min_label.setAlignment(self._ALIGN_RIGHT)
+        min_label.setObjectName("minLabel")
+        row_layout.addWidget(min_label)
+        
+        max_spin = QSpinBox(row_widget)
+        max_spin.setMinimum(1)
+        max_spin.setMaximum(20)
+        max_spin.setMinimumWidth(60)
+        max_spin.setMaximumWidth(60)
+        max_spin.setMinimumHeight(32)
+        max_spin.setMaximumHeight(32)
+        max_spin.setSizePolicy(self._SP_FIXED, self._SP_FIXED)
+        # Typed values only commit on Enter or focus out, so a partly typed number is never normalised
+        max_spin.setKeyboardTracking(False)
+        max_spin.valueChanged.connect(self._on_spin_value_changed)
+        row_layout.addWidget(max_spin)
+        
+        color_preview = QLabel(row_widget)
+        color_preview.setMinimumSize(45, 32)
+        color_preview.setMaximumSize(45, 32)
+        color_preview.setSizePolicy(self._SP_FIXED, self._SP_FIXED)
+        color_preview.setAlignment(self._ALIGN_CENTER)
+        row_layout.addWidget(color_preview)
+        
+        pick_button = QPushButton("Edit Colour", row_widget)
+        pick_button.setMinimumWidth(90)
+        pick_button.setMinimumHeight(32)
+        pick_button.setMaximumHeight(32)
+        pick_button.setSizePolicy(self._SP_FIXED, self._SP_FIXED)
+        pick_button.clicked.connect(self._on_pick_button_clicked)
+        row_layout.addWidget(pick_button)
+        
+        row_widget.setLayout(row_layout)
+        
+        row_widget._label = label
+        row_widget._remove_button = remove_button
+        row_widget._min_label = min_label
+        row_widget._max_spin = max_spin
+        row_widget._preview = color_preview
+        row_widget._pick_button = pick_button
+        return row_widget
+    
+    def _build_row(self, i: int) -> QWidget:
+        """
+        Fill a row for index i, reusing a pooled row when one is free, and insert it into the per-row lists.
+        
+        Args:
+            i: Index of the row in self.thresholds
             
-            if i < len(self.thresholds) - 1:
-                divider = QFrame(self.rows_container)
-                divider.setFrameShape(QFrame.Shape.HLine)
-                divider.setFrameShadow(QFrame.Shadow.Sunken)
-                divider.setFixedHeight(1)
-                divider.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-                divider.setStyleSheet("background-color: #333; border: none; max-height: 1px; min-height: 1px; margin: 0px; padding: 0px;")
-                self.rows_layout.addWidget(divider)
+        Returns:
+            The row widget, not yet added to rows_layout
+        """
+        if i == 0:
+            min_val = 1
+        else:
+            min_val = int(self.thresholds[i-1]) + 1
+        max_val = int(self.thresholds[i])
+        is_last = (i == len(self.thresholds) - 1)
+        if is_last:
+            max_val = 20
+            self.thresholds[i] = 20
+        range_text = f"{min_val}-{max_val}"
+        
+        row_widget = self._row_pool.pop() if self._row_pool else self._new_row()
+        
+        label = row_widget._label
+        label.setText(f"Range {i + 1}")
+        
+        removable_count = len(self.thresholds) - 4
+        remove_button = row_widget._remove_button
+        remove_button.setVisible(not is_last and i < removable_count)
+        
+        min_label = row_widget._min_label
+        min_label.setText(f"{min_val} - ")
+        
+        max_spin = row_widget._max_spin
+        self._set_spin_value(max_spin, max_val)
+        if max_spin.isEnabled() == is_last:
+            max_spin.setEnabled(not is_last)
+        
+        color_hex = self.colors[i] if i < len(self.colors) else "#FFFFFF"
+        color_preview = row_widget._preview
+        color_preview.setText(range_text)
+        color_preview.setStyleSheet(self._preview_style(color_hex))
+        
+        self.row_widgets.insert(i, row_widget)
+        self.row_labels.insert(i, label)
+        self.remove_buttons.insert(i, remove_button)
+        self.min_labels.insert(i, min_label)
+        self.max_spinboxes.insert(i, max_spin)
+        self.color_editors.insert(i, {
+            'preview': color_preview,
+            'button': row_widget._pick_button,
+            'color': color_hex,
+            'range_text': range_text
+        })
+        return row_widget
+    
+    def _insert_row(self, i: int):
+        """Build row i and place it into rows_layout."""
+        row_widget = self._build_row(i)
+        self.rows_layout.insertWidget(i, row_widget)
+        if row_widget.isHidden():
+            row_widget.show()
+    
+    def _disconnect_row(self, row_widget: QWidget):
+        """Disconnect a row's controls; deleteLater is deferred, so they could otherwise still reach the editor."""
+        row_widget._remove_button.clicked.disconnect(self._on_remove_button_clicked)
+        row_widget._max_spin.valueChanged.disconnect(self._on_spin_value_changed)
+        row_widget._pick_button.clicked.disconnect(self._on_pick_button_clicked)
+    
+    def _remove_row_widgets(self, i: int):
+        """Take row i out of the layout and return it to the pool, leaving the other rows in place."""
+        self.rows_layout.takeAt(i)
+        row_widget = self.row_widgets[i]
+        row_widget.hide()
+        if len(self._row_pool) < self._POOL_SIZE:
+            self._row_pool.append(row_widget)
+        else:
+            self._disconnect_row(row_widget)
+            row_widget.setParent(None)
+            row_widget.deleteLater()
+        
+        for widgets in (self.row_widgets, self.row_labels, self.remove_buttons,
+                        self.min_labels, self.max_spinboxes, self.color_editors):
+            widgets.pop(i)
+    
+    @contextmanager
+    def _suspend_row_layout(self):
+        """Hold off relayouts and repaints of the rows while several widgets are added or removed."""
+        if not self.rows_layout.isEnabled():
+            yield
+            return
+        self.rows_container.setUpdatesEnabled(False)
+        self.rows_layout.setEnabled(False)
+        try:
+            yield
+        finally:
+            self.rows_layout.setEnabled(True)
+            self.rows_layout.activate()
+            self.rows_container.setUpdatesEnabled(True)
+    
+    def _refresh_rows(self):
+        """Renumber the rows and bring their values in line with self.thresholds after an insert or removal."""
+        last_index = len(self.thresholds) - 1
+        if last_index >= 0:
+            self.thresholds[last_index] = 20
+        for i, (label, max_spin) in enumerate(zip(self.row_labels, self.max_spinboxes)):
+            label.setText(f"Range {i + 1}")
+            self._set_spin_value(max_spin, self.thresholds[i])
+            if max_spin.isEnabled() != (i != last_index):
+                max_spin.setEnabled(i != last_index)
+        mins = self._compute_min_values()
+        self._update_min_labels(mins)
+        self._update_ranges(mins)
+    
+    @pyqtSlot()
+    def _on_remove_button_clicked(self):
+        """Forward a row's remove button click with the row's current index."""
+        self._on_remove_row_clicked(self.remove_buttons.index(self.sender()))
+    
+    @pyqtSlot(int)
+    def _on_spin_value_changed(self, value: int):
+        """Queue a row's max spinbox change; _flush_pending_change applies it."""
+        index = self.max_spinboxes.index(self.sender())
+        if self._pending_change is not None and self._pending_change[0] != index:
+            self._flush_pending_change()
+        self._pending_change = (index, value)
+        self._throttle.start()
+    
+    @pyqtSlot()
+    def _flush_pending_change(self):
+        """Run the threshold cascade for the latest queued spinbox value, if any."""
+        self._throttle.stop()
+        if self._pending_change is None:
+            return
+        index, value = self._pending_change
+        self._pending_change = None
+        self._on_max_changed(index, value)
+    
+    @pyqtSlot()
+    def _on_pick_button_clicked(self):
+        """Open the colour picker for the row whose Edit Colour button was clicked."""
+        button = self.sender()
+        for index, editor in enumerate(self.color_editors):
+            if editor['button'] is button:
+                self._open_color_picker(index, editor['preview'])
+                return
     
     def _open_color_picker(self, index: int, preview: QLabel):
         """Open color picker dialog for the given index."""
@@ -227,13 +400,14 @@ class ThresholdEditor(QWidget):
             a = int(hex_str[6:8], 16)
             current_color.setAlpha(a)
         
-        color = QColorDialog.getColor(
-            current_color, 
-            self, 
-            "Edit Colour",
-            QColorDialog.ColorDialogOption.ShowAlphaChannel
-        )
-        if color.isValid():
+        # One dialog is kept and reused; building a QColorDialog is slow
+        if self._color_dialog is None:
+            self._color_dialog = QColorDialog(self)
+            self._color_dialog.setOption(QColorDialog.ColorDialogOption.ShowAlphaChannel)
+            self._color_dialog.setWindowTitle("Edit Colour")
+        self._color_dialog.setCurrentColor(current_color)
+        if self._color_dialog.exec():
+            color = self._color_dialog.currentColor()
             r = color.red()
             g = color.green()
             b = color.blue()
@@ -244,39 +418,37 @@ class ThresholdEditor(QWidget):
     def set_color(self, index: int, hex_color: str):
         """Set color for a specific threshold index."""
         if index < len(self.color_editors):
-            self.color_editors[index]['color'] = hex_color
-            preview = self.color_editors[index]['preview']
-            range_text = self.color_editors[index]['range_text']
-            preview.setText(range_text)
-            
-            rgba = self._hex_to_rgba_css(hex_color)
-            preview.setStyleSheet(
-                f"background-color: #0a0f1e; "
-                f"color: rgba({rgba}); "
-                f"border: none; "
-                f"border-radius: 4px; "
-                f"font-weight: bold; "
-                f"font-size: 13px;"
-            )
+            editor = self.color_editors[index]
+            if editor['color'] == hex_color and index < len(self.colors) and self.colors[index] == hex_color:
+                return
+            editor['color'] = hex_color
+            preview = editor['preview']
+            preview.setText(editor['range_text'])
+            preview.setStyleSheet(self._preview_style(hex_color))
             while len(self.colors) <= index:
                 self.colors.append("#FFFFFF")
             self.colors[index] = hex_color
-            self.colorsChanged.emit()
+            self._mark_dirty('colors')
+    
+    def _preview_style(self, hex_color: str) -> str:
+        """Get the preview box stylesheet for a colour, building it once per colour for all editors."""
+        style = _PREVIEW_STYLE_CACHE.get(hex_color)
+        if style is None:
+            style = _PREVIEW_TEMPLATE.format(rgba=self._hex_to_rgba_css(hex_color))
+            _PREVIEW_STYLE_CACHE[hex_color] = style
+        return style
     
-    def _hex_to_rgba_css(self, hex_color: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _hex_to_rgba_css(hex_color: str) -> str:
         """Convert hex color to CSS rgba() string."""
         hex_str = hex_color.lstrip('#')
         if len(hex_str) == 6:
-            r = int(hex_str[0:2], 16)
-            g = int(hex_str[2:4], 16)
-            b = int(hex_str[4:6], 16)
+            r, g, b = bytes.fromhex(hex_str)
             return f"{r}, {g}, {b}, 1.0"
         elif len(hex_str) == 8:
-            r = int(hex_str[0:2], 16)
-            g = int(hex_str[2:4], 16)
-            b = int(hex_str[4:6], 16)
-            a = int(hex_str[6:8], 16) / 255.0
-            return f"{r}, {g}, {b}, {a}"
+            r, g, b, a = bytes.fromhex(hex_str)
+            return f"{r}, {g}, {b}, {a / 255.0}"
         return "255, 255, 255, 1.0"
     
     def get_colors(self) -> list:
@@ -285,6 +457,9 @@ class ThresholdEditor(QWidget):
     
     def set_colors(self, colors: list):
         """Set colors from a list of hex strings."""
+        self.colors = list(colors)
+        if self.get_colors() == self.colors[:len(self.color_editors)]:
+            return
         for i, color_hex in enumerate(colors):
             if i < len(self.color_editors):
                 self.set_color(i, color_hex)
@@ -294,19 +469,40 @@ class ThresholdEditor(QWidget):
         for i, (min_val, max_val) in enumerate(ranges):
             if i < len(self.color_editors):
                 range_text = f"{min_val}-{max_val}"
-                self.color_editors[i]['range_text'] = range_text
-                preview = self.color_editors[i]['preview']
-                color_hex = self.color_editors[i]['color']
-                preview.setText(range_text)
-                rgba = self._hex_to_rgba_css(color_hex)
-                preview.setStyleSheet(
-                    f"background-color: #0a0f1e; "
-                    f"color: rgba({rgba}); "
-                    f"border: none; "
-                    f"border-radius: 4px; "
-                    f"font-weight: bold; "
-                    f"font-size: 13px;"
-                )
+                editor = self.color_editors[i]
+                if editor['range_text'] != range_text:
+                    editor['range_text'] = range_text
+                    editor['preview'].setText(range_text)
+    
+    def _mark_dirty(self, change: str):
+        """
+        Queue a change notification; _flush_signals emits it once the current operation has finished.
+        
+        Args:
+            change: 'thresholds', 'colors' or 'rows'
+        """
+        if not self._dirty_signals:
+            QTimer.singleShot(0, self._flush_signals)
+        self._dirty_signals.add(change)
+    
+    @pyqtSlot()
+    def _flush_signals(self):
+        """Emit each queued change signal once, in the order thresholds, colours, row count."""
+        dirty, self._dirty_signals = self._dirty_signals, set()
+        if 'thresholds' in dirty:
+            self.thresholdsChanged.emit(self.thresholds)
+        if 'colors' in dirty:
+            self.colorsChanged.emit()
+        if 'rows' in dirty:
+            self.rowCountChanged.emit()
+    
+    @staticmethod
+    def _set_spin_value(spin: QSpinBox, value: int):
+        """Set a spinbox value without emitting valueChanged, skipping the call when it already matches."""
+        if spin.value() != value:
+            spin.blockSignals(True)
+            spin.setValue(value)
+            spin.blockSignals(False)
     
     def _calculate_min_value(self, index: int) -> int:
         """Calculate the min value for a threshold based on previous threshold's max."""
@@ -315,191 +511,107 @@ class ThresholdEditor(QWidget):
         else:
             return self.thresholds[index - 1] + 1
     
-    def _update_min_labels(self):
+    def _compute_min_values(self) -> list:
+        """Get every row's min value in one pass: 1 for the first row, otherwise the previous max + 1."""
+        mins = [1]
+        mins.extend(threshold + 1 for threshold in self.thresholds[:-1])
+        return mins
+    
+    def _update_min_labels(self, mins: list = None):
         """Update all min labels based on current max values."""
-        for i in range(len(self.min_labels)):
-            min_val = self._calculate_min_value(i)
-            self.min_labels[i].setText(f"{min_val} - ")
+        if mins is None:
+            mins = self._compute_min_values()
+        for min_label, min_val in zip(self.min_labels, mins):
+            min_label.setText(f"{min_val} - ")
 
     def _on_max_changed(self, index: int, value: int):
         """Handle maximum value change."""
         if index < len(self.thresholds):
-            is_last = (index == len(self.thresholds) - 1)
-            if is_last:
-                if value != 20:
-                    self.max_spinboxes[index].blockSignals(True)
-                    self.max_spinboxes[index].setValue(20)
-                    self.max_spinboxes[index].blockSignals(False)
-                self.thresholds[index] = 20
-                self._update_ranges()
-                self.thresholdsChanged.emit(self.thresholds)
-                return
-            
-            old_value = self.thresholds[index]
-
-            min_value = self._calculate_min_value(index)
-            
-            if index < len(self.thresholds) - 1:
-                next_min = self._calculate_min_value(index + 1)
-                if value >= next_min:
-                    required_min = value + 1
-                    for i in range(index + 1, len(self.thresholds)):
-                        if i < len(self.max_spinboxes):
-                            current_max_spin = self.max_spinboxes[i]
-                            current_max_value = current_max_spin.value()
-                            
-                            if i == index + 1:
-                                required_min_for_this = value + 1
-                            else:
-                                required_min_for_this = self.thresholds[i - 1] + 1
-                            
-                            if current_max_value < required_min_for_this:
-                                current_max_spin.blockSignals(True)
-                                current_max_spin.setValue(required_min_for_this)
-                                self.thresholds[i] = required_min_for_this
-                                current_max_spin.blockSignals(False)
-                                
-                                self._update_min_labels()
-                                
-                                calculated_min = self._calculate_min_value(i)
-                                if calculated_min == required_min_for_this:
-                                    self._cascade_threshold_adjustment(i)
-                            
-                            required_min = self.thresholds[i] + 1
-            
-            if value < old_value:
-                self.thresholds[index] = value
-                
-                for i in range(index - 1, -1, -1):
-                    if i < len(self.max_spinboxes):
-                        next_threshold_max = self.thresholds[i + 1]
-                        new_max = next_threshold_max - 1
-                        
-                        if new_max >= 1:
-                            current_max_spin = self.max_spinboxes[i]
-                            current_max_value = current_max_spin.value()
-                            
-                            if current_max_value > new_max:
-                                current_max_spin.blockSignals(True)
-                                current_max_spin.setValue(new_max)
-                                self.thresholds[i] = new_max
-                                current_max_spin.blockSignals(False)
-                                
-                                calculated_min = self._calculate_min_value(i)
-                                
-                                if calculated_min == new_max:
-                                    pass
-                            else:
-                                self.thresholds[i] = current_max_value
-                
-                for i in range(index + 1, len(self.thresholds)):
-                    if i < len(self.max_spinboxes):
-                        calculated_min = self._calculate_min_value(i)
-                        
-                        current_max_spin = self.max_spinboxes[i]
-                        current_max_value = current_max_spin.value()
-                        
-                        new_max = current_max_value
-                        
-                        if current_max_value < calculated_min:
-                            new_max = calculated_min
-                        
-                        if new_max != current_max_value:
-                            current_max_spin.blockSignals(True)
-                            current_max_spin.setValue(new_max)
-                            self.thresholds[i] = new_max
-                            current_max_spin.blockSignals(False)
-                            
-                            calculated_min = self._calculate_min_value(i)
-                            
-                            if calculated_min == new_max:
-                                self._cascade_threshold_adjustment(i)
-                        else:
-                            self.thresholds[i] = current_max_value
-                
-                self._update_min_labels()
-                self._update_ranges()
-                self.thresholdsChanged.emit(self.thresholds)
-                return
-            
             self.thresholds[index] = value
-            self._update_min_labels()
-            self._update_ranges()
-            self.thresholdsChanged.emit(self.thresholds)
+            self._normalize_thresholds(index)
+            for max_spin, threshold in zip(self.max_spinboxes, self.thresholds):
+                self._set_spin_value(max_spin, threshold)
+            mins = self._compute_min_values()
+            self._update_min_labels(mins)
+            self._update_ranges(mins)
+            self._mark_dirty('thresholds')
     
-    def _cascade_threshold_adjustment(self, index: int):
-        """Cascade adjustment when a threshold's min and max become the same."""
-        if index > 0 and index < len(self.max_spinboxes):
-            current_min = self._calculate_min_value(index)
-            current_max = self.max_spinboxes[index].value()
-            
-            if current_min == current_max:
-                prev_max = current_max - 1
-                if prev_max >= 1 and index - 1 < len(self.max_spinboxes):
-                    prev_max_spin = self.max_spinboxes[index - 1]
-                    prev_max_spin.blockSignals(True)
-                    if prev_max_spin.value() > prev_max:
-                        prev_max_spin.setValue(prev_max)
-                        self.thresholds[index - 1] = prev_max
-                        self._update_min_labels()
-                        prev_min_calc = self._calculate_min_value(index - 1)
-                        if prev_min_calc == prev_max:
-                            self._cascade_threshold_adjustment(index - 1)
-                    prev_max_spin.blockSignals(False)
-    
-    def _update_ranges(self):
+    def _normalize_thresholds(self, pivot: int):
+        """
+        Make the thresholds strictly increasing and ending at 20 around an edited row.
+        
+        The edited value is first clamped so every other row keeps at least one
+        value. Rows after it are then pushed up and rows before it pulled down
+        as needed, one pass in each direction.
+        
+        Args:
+            pivot: Index of the row whose threshold was just set
+        """
+        thresholds = self.thresholds
+        last = len(thresholds) - 1
+        if pivot == last:
+            thresholds[pivot] = 20
+        else:
+            thresholds[pivot] = max(pivot + 1, min(thresholds[pivot], 20 - (last - pivot)))
+        for i in range(pivot + 1, last + 1):
+            thresholds[i] = min(max(thresholds[i], thresholds[i - 1] + 1), 20 - (last - i))
+        for i in range(pivot - 1, -1, -1):
+            thresholds[i] = max(min(thresholds[i], thresholds[i + 1] - 1), i + 1)
+    
+    def _update_ranges(self, mins: list = None):
         """Update the range text in color previews based on current threshold values."""
-        for i in range(len(self.min_labels)):
-            if i < len(self.max_spinboxes):
-                min_val = self._calculate_min_value(i)
-                max_val = self.max_spinboxes[i].value()
-                range_text = f"{min_val}-{max_val}"
-                
-                if i < len(self.color_editors):
-                    color_data = self.color_editors[i]
-                    if 'preview' in color_data:
-                        color_data['preview'].setText(range_text)
-                        color_hex = color_data.get('color', '#FFFFFF')
-                        rgba = self._hex_to_rgba_css(color_hex)
-                        color_data['preview'].setStyleSheet(
-                            f"background-color: #0a0f1e; "
-                            f"color: rgba({rgba}); "
-                            f"border: none; "
-                            f"border-radius: 4px; "
-                            f"font-weight: bold; "
-                            f"font-size: 13px;"
-                        )
+        if mins is None:
+            mins = self._compute_min_values()
+        for color_data, max_spin, min_val in zip(self.color_editors, self.max_spinboxes, mins):
+            range_text = f"{min_val}-{max_spin.value()}"
+            color_data['range_text'] = range_text
+            color_data['preview'].setText(range_text)
+    
+    def initialize(self, thresholds: list, style_classes: list, colors: list):
+        """
+        Build all rows from freshly loaded data in one pass.
+        
+        Colours are applied as each row is created rather than in a second
+        pass, and repaints are suspended until every row is in place.
+        
+        Args:
+            thresholds: Threshold values, one per row
+            style_classes: Style class names, one per row
+            colors: Hex colour strings, one per row
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self.set_style_classes(style_classes)
+            self.colors = list(colors)
+            self.set_thresholds(thresholds)
+            self._update_add_button_visibility()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def set_style_classes(self, style_classes: list):
+        """Set style classes; call before set_thresholds so the row counts match."""
+        self.style_classes = list(style_classes)
     
     def set_thresholds(self, thresholds: list):
         """Set thresholds from a list."""
-        self.thresholds = thresholds.copy()
-        self._clear_editors()
-        
-        if len(self.thresholds) != len(self.style_classes):
-            return
-        
-        if len(self.thresholds) > 0:
-            self._create_row_editors()
-            self._update_min_labels()
+        self._throttle.stop()
+        self._pending_change = None
+        self._remove_buttons_row_count = -1
+        self.thresholds = list(thresholds)
+        with self._suspend_row_layout():
+            self._clear_editors()
+            
+            if len(self.thresholds) != len(self.style_classes):
+                return
+            
+            if len(self.thresholds) > 0:
+                self._create_row_editors()
+                self._update_min_labels()
     
     def _clear_editors(self):
-        """Clear all row editors."""
-        self.color_editors.clear()
-        
-        if hasattr(self, 'rows_layout') and self.rows_layout:
-            while self.rows_layout.count() > 0:
-                item = self.rows_layout.takeAt(0)
-                if item:
-                    widget = item.widget()
-                    if widget:
-                        widget.hide()
-                        widget.setParent(None)
-                        widget.deleteLater()
-        
-        self.min_labels.clear()
-        self.max_spinboxes.clear()
-        self.row_widgets.clear()
-        self.remove_buttons.clear()
+        """Return every row editor to the pool, last row first so the pool hands them back in order."""
+        for i in range(len(self.row_widgets) - 1, -1, -1):
+            self._remove_row_widgets(i)
     
     def get_thresholds(self) -> list:
         """Get current thresholds."""
@@ -520,8 +632,10 @@ class ThresholdEditor(QWidget):
             ranges.append((min_val, max_val))
         return ranges
     
+    @pyqtSlot()
     def _on_add_row_clicked(self):
         """Handle Add Row button click - add a new row before the last row."""
+        self._flush_pending_change()
         if len(self.thresholds) >= 18:
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(
@@ -535,6 +649,7 @@ class ThresholdEditor(QWidget):
     
     def _on_remove_row_clicked(self, index: int):
         """Handle Remove button click - remove a row at the given index."""
+        self._flush_pending_change()
         if len(self.thresholds) <= 4:
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(
@@ -557,6 +672,7 @@ class ThresholdEditor(QWidget):
     
     def add_row_at_index(self, index: int, threshold: int, style_class: str, color: str):
         """Add a new row at the specified index. Called by MainWindow."""
+        self._flush_pending_change()
         threshold = min(threshold, 19)
         if index >= len(self.thresholds):
             index = len(self.thresholds) - 1 if len(self.thresholds) > 0 else 0
@@ -570,26 +686,22 @@ class ThresholdEditor(QWidget):
         if len(self.thresholds) > 0:
             self.thresholds[-1] = 20
         
-        self._clear_editors()
-        self._create_row_editors()
-        self._update_min_labels()
-        self._update_ranges()
+        with self._suspend_row_layout():
+            self._insert_row(index)
+            self._refresh_rows()
         
         if index < len(self.max_spinboxes):
             current_value = self.thresholds[index]
-            self.max_spinboxes[index].blockSignals(True)
-            self.max_spinboxes[index].setValue(current_value)
-            self.max_spinboxes[index].blockSignals(False)
+            self._set_spin_value(self.max_spinboxes[index], current_value)
             
             self._on_max_changed(index, current_value)
         
         self._update_add_button_visibility()
         self._update_remove_buttons_visibility()
         
-        self.thresholdsChanged.emit(self.thresholds)
-        self.colorsChanged.emit()
-        
-        self.rowCountChanged.emit()
+        self._mark_dirty('thresholds')
+        self._mark_dirty('colors')
+        self._mark_dirty('rows')
     
     def _validate_all_rows_after_insertion(self, start_index: int):
         """Validate and fix all rows after inserting a new row, working backwards from the last row."""
@@ -597,9 +709,7 @@ class ThresholdEditor(QWidget):
             current_max = self.thresholds[start_index]
             if current_max > 19:
                 current_max = 19
-                self.max_spinboxes[start_index].blockSignals(True)
-                self.max_spinboxes[start_index].setValue(19)
-                self.max_spinboxes[start_index].blockSignals(False)
+                self._set_spin_value(self.max_spinboxes[start_index], 19)
                 self.thresholds[start_index] = 19
         
         for i in range(len(self.thresholds) - 1, start_index - 1, -1):
@@ -609,10 +719,9 @@ class ThresholdEditor(QWidget):
                 
                 if i == len(self.thresholds) - 1:
                     if current_max != 20:
-                        self.max_spinboxes[i].blockSignals(True)
-                        self.max_spinboxes[i].setValue(20)
-                        self.max_spinboxes[i].setEnabled(False)
-                        self.max_spinboxes[i].blockSignals(False)
+                        self._set_spin_value(self.max_spinboxes[i], 20)
+                        if self.max_spinboxes[i].isEnabled():
+                            self.max_spinboxes[i].setEnabled(False)
                         self.thresholds[i] = 20
                 else:
                     next_min = self._calculate_min_value(i + 1)
@@ -627,10 +736,8 @@ class ThresholdEditor(QWidget):
                         new_max = max(1, new_max)
                     
                     if new_max != current_max:
-                        self.max_spinboxes[i].blockSignals(True)
-                        self.max_spinboxes[i].setValue(new_max)
+                        self._set_spin_value(self.max_spinboxes[i], new_max)
                         self.thresholds[i] = new_max
-                        self.max_spinboxes[i].blockSignals(False)
         
         for i in range(start_index, len(self.thresholds)):
             if i < len(self.max_spinboxes):
@@ -639,62 +746,65 @@ class ThresholdEditor(QWidget):
                 
                 if i == len(self.thresholds) - 1:
                     if current_max != 20:
-                        self.max_spinboxes[i].blockSignals(True)
-                        self.max_spinboxes[i].setValue(20)
-                        self.max_spinboxes[i].setEnabled(False)
-                        self.max_spinboxes[i].blockSignals(False)
+                        self._set_spin_value(self.max_spinboxes[i], 20)
+                        if self.max_spinboxes[i].isEnabled():
+                            self.max_spinboxes[i].setEnabled(False)
                         self.thresholds[i] = 20
                 else:
                     if current_max < calculated_min:
                         new_max = calculated_min
                         new_max = min(new_max, 19)
                         
-                        self.max_spinboxes[i].blockSignals(True)
-                        self.max_spinboxes[i].setValue(new_max)
+                        self._set_spin_value(self.max_spinboxes[i], new_max)
                         self.thresholds[i] = new_max
-                        self.max_spinboxes[i].blockSignals(False)
         
         if len(self.thresholds) > 0:
             last_index = len(self.thresholds) - 1
             self.thresholds[last_index] = 20
             if last_index < len(self.max_spinboxes):
-                self.max_spinboxes[last_index].blockSignals(True)
-                self.max_spinboxes[last_index].setValue(20)
-                self.max_spinboxes[last_index].setEnabled(False)
-                self.max_spinboxes[last_index].blockSignals(False)
+                self._set_spin_value(self.max_spinboxes[last_index], 20)
+                if self.max_spinboxes[last_index].isEnabled():
+                    self.max_spinboxes[last_index].setEnabled(False)
         
         self._update_min_labels()
         self._update_ranges()
     
     def remove_row_at_index(self, index: int):
         """Remove a row at the specified index. Called by MainWindow."""
+        self._flush_pending_change()
         self.thresholds.pop(index)
         self.style_classes.pop(index)
         self.colors.pop(index)
         
-        self._clear_editors()
-        self._create_row_editors()
-        self._update_min_labels()
-        self._update_ranges()
+        with self._suspend_row_layout():
+            self._remove_row_widgets(index)
+            self._refresh_rows()
         
         self._update_add_button_visibility()
         self._update_remove_buttons_visibility()
         
-        self.thresholdsChanged.emit(self.thresholds)
-        self.colorsChanged.emit()
-        
-        self.rowCountChanged.emit()
+        self._mark_dirty('thresholds')
+        self._mark_dirty('colors')
+        self._mark_dirty('rows')
     
     def _update_add_button_visibility(self):
         """Update visibility of Add Row button based on row count."""
         if hasattr(self, 'add_row_button'):
-            self.add_row_button.setEnabled(len(self.thresholds) < 18)
+            can_add = len(self.thresholds) < 18
+            if can_add != self._add_row_enabled:
+                self.add_row_button.setEnabled(can_add)
+                self._add_row_enabled = can_add
     
     def _update_remove_buttons_visibility(self):
-        """Update visibility of remove buttons based on row count."""
-        removable_count = len(self.thresholds) - 4
-        for i, button in enumerate(self.remove_buttons):
-            if button is not None:
-                is_last = (i == len(self.thresholds) - 1)
-                can_remove_this_row = not is_last and i < removable_count
+        """Update visibility of remove buttons based on row count, touching only buttons that change."""
+        row_count = len(self.thresholds)
+        if row_count == self._remove_buttons_row_count:
+            return
+        self._remove_buttons_row_count = row_count
+        last_index = row_count - 1
+        removable_count = last_index - 3
+        buttons = self.remove_buttons
+        wanted = [i != last_index and i < removable_count for i in range(len(buttons))]
+        for button, can_remove_this_row in zip(buttons, wanted):
+            if button.isHidden() == can_remove_this_row:
                 button.setVisible(can_remove_this_row)
\ No newline at end of file
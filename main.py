@@ -1,47 +1,38 @@
 """Main entry point for FM26 Attribute Customizer."""
 import sys
-from pathlib import Path
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
-from gui.main_window import MainWindow
-
-
-def get_icon_path():
-    """Get the path to the icon file, handling both development and PyInstaller builds."""
-    if getattr(sys, 'frozen', False):
-        # Running from PyInstaller executable
-        # Try to find icon in the same directory as the executable
-        base_path = Path(sys.executable).parent
-    else:
-        # Running from source
-        base_path = Path(__file__).parent
-    
-    # Try .ico first (Windows)
-    icon_path = base_path / "icon.ico"
-    if icon_path.exists():
-        return str(icon_path)
-    
-    # Try .png as fallback
-    icon_path = base_path / "icon.png"
-    if icon_path.exists():
-        return str(icon_path)
-    
-    return None
+from PyQt6.QtCore import QTimer
+from gui.main_window import MainWindow, get_icon_path
+
+# Application icon, built on the first call to main() and reused after that
+_APP_ICON = None
+
+
+def _apply_app_icon(app: QApplication, icon_path: str):
+    """Set the application icon, decoding the file only the first time."""
+    global _APP_ICON
+    if _APP_ICON is None:
+        from PyQt6.QtGui import QIcon
+        _APP_ICON = QIcon(icon_path)
+    app.setWindowIcon(_APP_ICON)
 
 
 def main():
     """Launch the application."""
-    app = QApplication(sys.argv)
-    app.setApplicationName("FM26 Attribute Customizer - by MW90")
-    
-    # Set application icon if available
+    # Probe for the icon before Qt starts up; it is applied once the window has been shown
     icon_path = get_icon_path()
-    if icon_path:
-        app.setWindowIcon(QIcon(icon_path))
+    
+    # Set before the application exists so it starts with this name and emits no change
+    QApplication.setApplicationName("FM26 Attribute Customizer - by MW90")
+    app = QApplication(sys.argv)
     
     window = MainWindow()
     window.show()
     
+    # Set application icon if available
+    if icon_path:
+        QTimer.singleShot(0, lambda: _apply_app_icon(app, icon_path))
+    
     sys.exit(app.exec())
 
 
@@ -0,0 +1,70 @@
+"""Regression checks for ThresholdEditor keyboard entry."""
+import os
+import sys
+import time
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtTest import QTest
+    from PyQt6.QtWidgets import QApplication
+except ImportError:  # pragma: no cover - PyQt6 is a runtime requirement
+    QApplication = None
+
+
+def _pump(app, seconds: float):
+    """Process events for a while, as the gaps between real keystrokes would."""
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        app.processEvents()
+
+
+@unittest.skipIf(QApplication is None, "PyQt6 is not installed")
+class ThresholdEditorKeyboardEntryTest(unittest.TestCase):
+    """Typing a multi-digit value must not be normalised one keystroke at a time."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        from gui.threshold_editor import ThresholdEditor
+        self.editor = ThresholdEditor([], [], [])
+        self.editor.show()
+        thresholds = list(range(2, 21, 2))
+        self.editor.initialize(thresholds, ["s"] * len(thresholds), ["#FFFFFFFF"] * len(thresholds))
+
+    def tearDown(self):
+        self.editor.close()
+        self.editor.deleteLater()
+        _pump(self.app, 0.01)
+
+    def _type_into(self, spin, text: str, finish=Qt.Key.Key_Return):
+        spin.setFocus()
+        spin.selectAll()
+        # Longer gaps than the editor's change throttle, like a person typing
+        for ch in text:
+            QTest.keyClick(spin, ch)
+            _pump(self.app, 0.1)
+        QTest.keyClick(spin, finish)
+        _pump(self.app, 0.1)
+
+    def test_multi_digit_entry_keeps_other_rows(self):
+        spin = self.editor.max_spinboxes[7]
+        self._type_into(spin, "17")
+        self.assertEqual(self.editor.thresholds, [2, 4, 6, 8, 10, 12, 14, 17, 18, 20])
+        self.assertEqual(spin.value(), 17)
+
+    def test_partial_entry_does_not_change_thresholds(self):
+        spin = self.editor.max_spinboxes[7]
+        spin.setFocus()
+        spin.selectAll()
+        QTest.keyClick(spin, "1")
+        _pump(self.app, 0.1)
+        self.assertEqual(self.editor.thresholds, list(range(2, 21, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()